@@ -4,7 +4,25 @@ from coderr_app.models import Review
 from .serializers import ReviewListSerializer
 
 
-class ReviewFilter(filters.FilterSet):
+class CachedFormFilterSet(filters.FilterSet):
+    """
+    FilterSet that builds its form class once per subclass instead of on every request.
+
+    django-filter creates a new Form type from the declared filters for each FilterSet instance.
+    The filters here hold no per-request state, and Django copies `base_fields` into every form
+    instance, so the generated class can be shared.
+    """
+
+    def get_form_class(self):
+        cls = type(self)
+        form_class = cls.__dict__.get("_form_class")
+        if form_class is None:
+            form_class = super().get_form_class()
+            cls._form_class = form_class
+        return form_class
+
+
+class ReviewFilter(CachedFormFilterSet):
     """
     Enables filtering of reviews by business user or reviewer.
 
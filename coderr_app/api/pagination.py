@@ -1,26 +1,86 @@
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import PageNumberPagination, CursorPagination
 
 
-class OfferListPagination:
+class OfferListPagination(PageNumberPagination):
     """
     Custom pagination class for offer listings.
 
     - Defaults to 6 items per page.
     - Allows clients to adjust page size via the `page_size` query parameter (max: 100).
-    - Uses DRF’s PageNumberPagination internally.
+    - Uses DRF’s PageNumberPagination directly.
     """
     page_size = 6
     page_size_query_param = "page_size"
     max_page_size = 100
 
-    def paginate_queryset(self, queryset, request, view=None):
-        from rest_framework.pagination import PageNumberPagination
-        paginator = PageNumberPagination()
-        paginator.page_size = self.page_size
-        paginator.page_size_query_param = self.page_size_query_param
-        paginator.max_page_size = self.max_page_size
-        self.paginator = paginator
-        return paginator.paginate_queryset(queryset, request, view=view)
-
-    def get_paginated_response(self, data):
-        return self.paginator.get_paginated_response(data)
+
+class FixedOrderingCursorPagination(CursorPagination):
+    """
+    Cursor pagination that always seeks along its own `ordering`.
+
+    - Ignores `?ordering=`: DRF positions the cursor on the first ordering field only, so that field
+      must be immutable and close to unique. Later fields such as `-id` only fix the order of equal values.
+    """
+
+    def get_ordering(self, request, queryset, view):
+        return self.ordering
+
+
+class OfferCursorPagination(FixedOrderingCursorPagination):
+    """
+    Keyset pagination for offer listings.
+
+    - Seeks along `-created_at` instead of using OFFSET, so deep pages cost the same as the first one.
+    - Uses the immutable creation time so that editing an offer does not move it between pages.
+    - Shares page size settings with OfferListPagination.
+    - Returns `next`/`previous` cursors instead of page numbers and a total count.
+    """
+    page_size = OfferListPagination.page_size
+    page_size_query_param = OfferListPagination.page_size_query_param
+    max_page_size = OfferListPagination.max_page_size
+    ordering = ("-created_at", "-id")
+
+
+class OptionalPageNumberPagination(PageNumberPagination):
+    """
+    Page number pagination that only applies when the client asks for it.
+
+    - Without a `page_size` query parameter the full, unpaginated list is returned as before.
+    - With `?page_size=N` (max: 100) the response is paginated and `page` selects the page.
+    """
+    page_size = None
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+
+class ReviewCursorPagination(FixedOrderingCursorPagination):
+    """
+    Keyset pagination for review listings.
+
+    - Seeks along `-created_at` instead of counting rows and using OFFSET.
+    - Uses the immutable creation time so that editing a review does not move it between pages;
+      the page number path keeps the view's `-updated_at` ordering.
+    - Shares page size limits with OptionalPageNumberPagination, defaulting to 20 items per page.
+    """
+    page_size = 20
+    page_size_query_param = OptionalPageNumberPagination.page_size_query_param
+    max_page_size = OptionalPageNumberPagination.max_page_size
+    ordering = ("-created_at", "-id")
+
+
+class CursorOptInMixin:
+    """
+    View mixin that switches to `cursor_pagination_class` when the request carries a `cursor`
+    query parameter (empty for the first page) and uses `pagination_class` otherwise.
+    """
+    cursor_pagination_class = None
+
+    @property
+    def paginator(self):
+        if not hasattr(self, "_paginator"):
+            cursor_class = self.cursor_pagination_class
+            if cursor_class and cursor_class.cursor_query_param in self.request.query_params:
+                self._paginator = cursor_class()
+            else:
+                self._paginator = self.pagination_class() if self.pagination_class else None
+        return self._paginator
@@ -1,4 +1,22 @@
 from rest_framework import permissions
+from .utils import get_user_type
+
+
+_UNSET = object()
+
+
+def get_request_user_type(request):
+    """
+    Returns the profile type of the requesting user, or None if there is none.
+    The value comes from the shared user type cache and is memoized on the request,
+    so repeated permission checks do not look it up again.
+    """
+    cached = getattr(request, "_user_type", _UNSET)
+    if cached is _UNSET:
+        u = request.user
+        cached = get_user_type(u.id) if u and u.is_authenticated else None
+        request._user_type = cached
+    return cached
 
 
 class IsBusinessUser(permissions.BasePermission):
@@ -10,8 +28,7 @@ class IsBusinessUser(permissions.BasePermission):
     def has_permission(self, request, view):
         if request.method != "POST":
             return True
-        u = request.user
-        return bool(u and u.is_authenticated and hasattr(u, "profile") and u.profile.user_type == "business")
+        return get_request_user_type(request) == "business"
 
 
 class IsCustomerUser(permissions.BasePermission):
@@ -23,6 +40,14 @@ class IsCustomerUser(permissions.BasePermission):
     def has_permission(self, request, view):
         if request.method != "POST":
             return True
-        u = request.user
-        return bool(
-            u and u.is_authenticated and hasattr(u, "profile") and getattr(u.profile, "user_type", None) == "customer")
+        return get_request_user_type(request) == "customer"
+
+
+class IsReviewer(permissions.BasePermission):
+    """
+    Grants object access only to the user who wrote the review
+    """
+    message = "You do not have permission to perform this action."
+
+    def has_object_permission(self, request, view, obj):
+        return obj.reviewer_id == request.user.id
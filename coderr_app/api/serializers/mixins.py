@@ -0,0 +1,22 @@
+class SparseFieldsetMixin:
+    """
+    Lets clients restrict the serialized fields of a read request via `?fields=a,b,c`.
+
+    - Unrequested fields are removed before serialization, so their getters never run.
+    - Unknown names are ignored; if none of the requested names exist, all fields are returned.
+    """
+
+    fields_query_param = "fields"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        request = self.context.get("request")
+        if request is None or request.method != "GET":
+            return
+        requested = request.query_params.get(self.fields_query_param)
+        if not requested:
+            return
+        allowed = {name.strip() for name in requested.split(",")} & set(self.fields)
+        if allowed:
+            for name in set(self.fields) - allowed:
+                self.fields.pop(name)
@@ -1,12 +1,36 @@
+from functools import lru_cache
 from rest_framework import serializers
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Q
 from coderr_app.models import Offer, OfferDetail
 from django.urls import reverse
 from ..fields import Base64ImageField
+from ..utils import build_absolute_url
+from .mixins import SparseFieldsetMixin
 
 
 User = get_user_model()
 
+_OFFER_TEXT_FIELDS = ("title", "description")
+# (payload key, OfferDetail attribute) pairs a detail PATCH may change
+_DETAIL_FIELD_MAP = (
+    ("title", "title"),
+    ("revisions", "revisions"),
+    ("delivery_time_in_days", "delivery_time"),
+    ("price", "price"),
+    ("features", "features"),
+)
+
+
+@lru_cache(maxsize=None)
+def _offer_detail_item_prefix():
+    """
+    Returns the resolved path of the offer detail endpoint without its id, e.g. "/api/offerdetails/".
+    """
+    return reverse("offer-detail-item", kwargs={"id": 0})[:-len("0/")]
+
 
 class OfferDetailSerializer(serializers.Serializer):
     """
@@ -17,24 +41,22 @@ class OfferDetailSerializer(serializers.Serializer):
     """
 
     id = serializers.IntegerField()
-    url = serializers.SerializerMethodField()
+    url = serializers.ReadOnlyField(source="url_path")
 
-    def get_url(self, obj):
-        return f"/offerdetails/{obj.id}/"
 
-
-class OfferListSerializer(serializers.ModelSerializer):
+class OfferListSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Serializer for listing offers with summary details.
 
     - Includes offer metadata, pricing, delivery time, and related detail URLs.
-    - Embeds basic creator information (username, first/last name).
+    - Embeds basic creator information (username, first/last name), built once per creator and page.
     - Returns absolute image URLs when available.
+    - Supports sparse fieldsets via `?fields=id,title,min_price`.
     - Used in GET /api/offers/ for paginated offer listings.
     """
 
     user = serializers.IntegerField(source="user.id", read_only=True)
-    details = serializers.SerializerMethodField()
+    details = serializers.ReadOnlyField(source="details_urls")
     min_price = serializers.DecimalField(
         max_digits=10, decimal_places=2, read_only=True)
     min_delivery_time = serializers.IntegerField(read_only=True)
@@ -48,28 +70,28 @@ class OfferListSerializer(serializers.ModelSerializer):
             "user_details",
         ]
 
-    def get_details(self, obj):
-        data = []
-        for d in getattr(obj, "_prefetched_details", obj.details.all()):
-            data.append({"id": d.id, "url": f"/offerdetails/{d.id}/"})
-        return data
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._user_details_cache = {}
 
     def get_user_details(self, obj):
-        u = obj.user
-        return {
-            "fist_name": u.first_name or "",
-            "last_name": u.last_name or "",
-            "username": u.username,
-        }
+        details = self._user_details_cache.get(obj.user_id)
+        if details is None:
+            u = obj.user
+            details = self._user_details_cache[obj.user_id] = {
+                "fist_name": u.first_name or "",
+                "last_name": u.last_name or "",
+                "username": u.username,
+            }
+        return details
 
     def to_representation(self, instance):
         data = super().to_representation(instance)
-        if instance.image:
-            request = self.context.get("request")
-            url = instance.image.url
-            data["image"] = request.build_absolute_uri(url) if request else url
-        else:
-            data["image"] = None
+        if "image" in data:
+            if instance.image:
+                data["image"] = build_absolute_url(self.context, instance.image.url)
+            else:
+                data["image"] = None
         return data
 
 
@@ -118,20 +140,31 @@ class OfferCreateSerializer(serializers.ModelSerializer):
                 "An offer must contain at least 3 details")
         return value
 
+    @transaction.atomic
     def create(self, validated_data):
         details_data = validated_data.pop("details", [])
 
         if "image" in validated_data and not validated_data["image"]:
             validated_data["image"] = None
 
+        if details_data:
+            validated_data["min_price"] = min(d["price"] for d in details_data)
+            validated_data["min_delivery_time"] = min(
+                d["delivery_time"] for d in details_data)
+
         user = self.context["request"].user
         offer = Offer.objects.create(user=user, **validated_data)
-        OfferDetail.objects.bulk_create(
-            [OfferDetail(offer=offer, **d) for d in details_data])
-        offer.refresh_from_db()
+        offer._created_details = OfferDetail.objects.bulk_create(
+            [OfferDetail(offer=offer, **d) for d in details_data],
+            batch_size=getattr(settings, "CODERR_BULK_BATCH", 100))
         return offer
 
     def to_representation(self, instance):
+        details = getattr(instance, "_created_details", None)
+        if details is None or any(d.id is None for d in details):
+            details = instance.details.all().order_by("id")
+        else:
+            details = sorted(details, key=lambda d: d.id)
         data = {
 
             "id": instance.id,
@@ -148,7 +181,7 @@ class OfferCreateSerializer(serializers.ModelSerializer):
                     "features": d.features or [],
                     "offer_type": d.offer_type,
                 }
-                for d in instance.details.all().order_by("id")
+                for d in details
             ],
 
         }
@@ -178,13 +211,8 @@ class OfferRetrieveSerializer(serializers.ModelSerializer):
         ]
 
     def get_details(self, obj):
-        request = self.context.get("request")
-        items = []
-        for d in obj.details.all():
-            path = reverse("offer-detail-item", kwargs={"id": d.id})
-            url = request.build_absolute_uri(path) if request else path
-            items.append({"id": d.id, "url": url})
-        return items
+        base = build_absolute_url(self.context, _offer_detail_item_prefix())
+        return [{"id": d.id, "url": f"{base}{d.id}/"} for d in obj.details.all()]
 
     def to_representation(self, instance):
         data = super().to_representation(instance)
@@ -204,8 +232,8 @@ class OfferDetailPatchSerializer(serializers.Serializer):
     """
 
     id = serializers.IntegerField(required=False)
-    offer_type = serializers.ChoiceField(choices=[(
-        "basic", "basic"), ("standard", "standard"), ("premium", "premium")], required=True)
+    offer_type = serializers.ChoiceField(
+        choices=OfferDetail.OFFER_TYPE_CHOICES, required=True)
     title = serializers.CharField(required=False, allow_blank=True)
     revisions = serializers.IntegerField(required=False, min_value=0)
     delivery_time_in_days = serializers.IntegerField(
@@ -215,10 +243,10 @@ class OfferDetailPatchSerializer(serializers.Serializer):
     features = serializers.ListField(
         child=serializers.CharField(), required=False, allow_empty=True)
 
+    _CHANGE_FIELDS = frozenset(src for src, _ in _DETAIL_FIELD_MAP)
+
     def validate(self, attrs):
-        change_fields = {"title", "revisions",
-                         "delivery_time_in_days", "price", "features"}
-        if not any(k in attrs for k in change_fields):
+        if not (attrs.keys() & self._CHANGE_FIELDS):
             raise serializers.ValidationError(
                 "No update fields provided for detail")
         return attrs
@@ -241,54 +269,65 @@ class OfferUpdateSerializer(serializers.ModelSerializer):
         model = Offer
         fields = ["title", "image", "description", "details"]
 
+    @transaction.atomic
     def update(self, instance, validated_data):
-        for attr in ["title", "description"]:
+        for attr in _OFFER_TEXT_FIELDS:
             if attr in validated_data:
                 setattr(instance, attr, validated_data[attr])
 
         if "image" in validated_data:
             instance.image = validated_data["image"]
 
+        # Bumps updated_at, which keys the offer detail cache and ETag; bulk_update below sends no signals.
         instance.save()
 
         details_payload = validated_data.get("details")
         if details_payload:
+            ids = [d["id"] for d in details_payload if d.get("id") is not None]
+            types = [d["offer_type"] for d in details_payload if d.get("id") is None]
+            existing = {
+                d.id: d for d in OfferDetail.objects
+                .filter(offer=instance)
+                .filter(Q(id__in=ids) | Q(offer_type__in=types))
+                .only("id", "offer_type", *(dst for _, dst in _DETAIL_FIELD_MAP))
+            }
+            by_type = {}
+            for d in existing.values():
+                by_type.setdefault(d.offer_type, []).append(d)
+
+            changed = {}
             for d in details_payload:
                 detail_obj = None
                 detail_id = d.get("id")
                 offer_type = d.get("offer_type")
 
                 if detail_id is not None:
-                    try:
-                        detail_obj = OfferDetail.objects.get(
-                            id=detail_id, offer=instance)
-                    except OfferDetail.DoesNotExist:
+                    detail_obj = existing.get(detail_id)
+                    if detail_obj is None:
                         raise serializers.ValidationError(
                             {"details": f"Detail with id={detail_id} not found for this offer"})
                 else:
-                    qs = OfferDetail.objects.filter(
-                        offer=instance, offer_type=offer_type)
-                    count = qs.count()
-                    if count == 0:
+                    matches = by_type.get(offer_type, [])
+                    if len(matches) == 0:
                         raise serializers.ValidationError(
                             {"details": f"No detail with offer_type='{offer_type}' for this offer"})
-                    if count > 1:
+                    if len(matches) > 1:
                         raise serializers.ValidationError(
                             {"details": f"Multiple details with offer_type='{offer_type}' found; provide 'id' to disambiguate"})
-                    detail_obj = qs.first()
-
-                if "title" in d:
-                    detail_obj.title = d["title"]
-                if "revisions" in d:
-                    detail_obj.revisions = d["revisions"]
-                if "delivery_time_in_days" in d:
-                    detail_obj.delivery_time = d["delivery_time_in_days"]
-                if "price" in d:
-                    detail_obj.price = d["price"]
-                if "features" in d:
-                    detail_obj.features = d["features"]
-
-                detail_obj.save()
+                    detail_obj = matches[0]
+
+                for src, dst in _DETAIL_FIELD_MAP:
+                    if src in d:
+                        setattr(detail_obj, dst, d[src])
+
+                changed[detail_obj.id] = detail_obj
+
+            OfferDetail.objects.bulk_update(
+                changed.values(), fields=[dst for _, dst in _DETAIL_FIELD_MAP],
+                batch_size=getattr(settings, "CODERR_BULK_BATCH", 100))
+            if any("price" in d or "delivery_time_in_days" in d for d in details_payload):
+                instance.min_price, instance.min_delivery_time = Offer.refresh_min_values(
+                    instance.id)
         return instance
 
 
@@ -1,6 +1,7 @@
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
 from coderr_app.models import OfferDetail, Order
+from ..utils import format_datetime, format_price
 
 
 User = get_user_model()
@@ -11,6 +12,7 @@ class OrderListSerializer(serializers.ModelSerializer):
     Serializer to present the needed information about an Order
 
     -Provieds all key information such as id, customer_user, business_user,title, revisions etc.
+    -Builds the output dict directly, as this serializer is read-only and used for whole lists.
     """
     class Meta:
         model = Order
@@ -29,13 +31,29 @@ class OrderListSerializer(serializers.ModelSerializer):
             "updated_at",
         ]
 
+    def to_representation(self, instance):
+        return {
+            "id": instance.id,
+            "customer_user": instance.customer_user_id,
+            "business_user": instance.business_user_id,
+            "title": instance.title,
+            "revisions": instance.revisions,
+            "delivery_time_in_days": instance.delivery_time_in_days,
+            "price": format_price(instance.price),
+            "features": instance.features,
+            "offer_type": instance.offer_type,
+            "status": instance.status,
+            "created_at": format_datetime(instance.created_at),
+            "updated_at": format_datetime(instance.updated_at),
+        }
+
 
 class OrderCreateSerializer(serializers.Serializer):
     """
     Serializer for creating new orders based on an existing offer detail.
 
     - Accepts an `offer_detail_id` to generate an order from.
-    - Validates that the referenced OfferDetail exists.
+    - Validates that the referenced OfferDetail exists and keeps it for `create`, so it is fetched once.
     - Automatically assigns the authenticated user as the customer
       and links the corresponding business user from the offer.
     - Copies relevant fields (title, price, delivery time, etc.) into the new order.
@@ -45,7 +63,15 @@ class OrderCreateSerializer(serializers.Serializer):
     offer_detail_id = serializers.IntegerField()
 
     def validate_offer_detail_id(self, value):
-        if not OfferDetail.objects.filter(pk=value).exists():
+        try:
+            self._detail = (
+                OfferDetail.objects
+                .select_related("offer")
+                .only("id", "title", "revisions", "delivery_time", "price", "features", "offer_type",
+                      "offer__user_id")
+                .get(pk=value)
+            )
+        except OfferDetail.DoesNotExist:
             raise serializers.ValidationError("OfferDetail not found")
         return value
 
@@ -53,13 +79,11 @@ class OrderCreateSerializer(serializers.Serializer):
         request = self.context["request"]
         customer = request.user
 
-        detail = OfferDetail.objects.select_related(
-            "offer__user").get(pk=validated_data["offer_detail_id"])
-        business = detail.offer.user
+        detail = self._detail
 
         order = Order.objects.create(
             customer_user=customer,
-            business_user=business,
+            business_user_id=detail.offer.user_id,
             title=detail.title,
             revisions=detail.revisions,
             delivery_time_in_days=detail.delivery_time,
@@ -80,19 +104,21 @@ class OrderStatusUpdateSerializer(serializers.ModelSerializer):
     - Used for PATCH /api/orders/{id}/ endpoint.
     """
 
+    _VALID_STATUSES = frozenset(k for k, _ in Order.STATUS_CHOICES)
+    _STATUS_ONLY = frozenset({"status"})
+
     class Meta:
         model = Order
         fields = ["status"]
         extra_kwargs = {"status": {"required": True}}
 
     def validate(self, attrs):
-        extra = set(self.initial_data.keys()) - {"status"}
+        extra = self.initial_data.keys() - self._STATUS_ONLY
         if extra:
             raise serializers.ValidationError("Only 'status' may be updated")
 
         status_value = attrs.get("status")
-        valid = {k for k, _ in Order.STATUS_CHOICES}
-        if status_value not in valid:
+        if status_value not in self._VALID_STATUSES:
             raise serializers.ValidationError(
-                {"status": f"Invalid status. Allowed: {', '.join(sorted(valid))}"})
+                {"status": f"Invalid status. Allowed: {', '.join(sorted(self._VALID_STATUSES))}"})
         return attrs
@@ -1,10 +1,16 @@
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
+from django.db import transaction, IntegrityError
 from coderr_app.models import Profile
+from ..utils import build_absolute_url, format_datetime
 
 
 User = get_user_model()
 
+_BLANKABLE_FIELDS = ("first_name", "last_name", "location",
+                     "tel", "description", "working_hours")
+_PROFILE_TEXT_FIELDS = ("location", "tel", "description", "working_hours")
+
 
 class ProfileSerializer(serializers.ModelSerializer):
     """
@@ -13,7 +19,7 @@ class ProfileSerializer(serializers.ModelSerializer):
     - Includes user-related fields (username, email, first/last name) and profile-specific fields (location, tel, description, etc.).
     - Ensures image URLs are returned as absolute paths.
     - Replaces null/None values with empty strings for cleaner frontend handling.
-    - Validates unique email addresses before saving.
+    - Rejects email addresses already in use, enforced by the unique index on the user table.
     - Handles nested updates for both User and Profile models.
     """
 
@@ -45,45 +51,46 @@ class ProfileSerializer(serializers.ModelSerializer):
     def to_representation(self, instance):
         data = super().to_representation(instance)
         if instance.file:
-            req = self.context.get("request")
-            url = instance.file.url
-            data["file"] = req.build_absolute_uri(url) if req else url
+            data["file"] = build_absolute_url(self.context, instance.file.url)
         else:
             data["file"] = ""
 
-        for k in ["first_name", "last_name", "location", "tel", "description", "working_hours"]:
-            data[k] = data.get(k) or ""
+        for k in _BLANKABLE_FIELDS:
+            if not data.get(k):
+                data[k] = ""
         return data
 
-    def validate(self, attrs):
-        user_data = attrs.get("user", {})
-        new_email = user_data.get("email")
-        if new_email:
-            qs = User.objects.filter(email=new_email)
-            if self.instance:
-                qs = qs.exclude(pk=self.instance.user_id)
-            if qs.exists():
-                raise serializers.ValidationError(
-                    {"email": "This email is already in use."})
-        return attrs
-
     def update(self, instance, validated_data):
         user_data = validated_data.pop("user", {})
+        user_update_fields = []
         if "first_name" in user_data:
             instance.user.first_name = user_data["first_name"] or ""
+            user_update_fields.append("first_name")
         if "last_name" in user_data:
             instance.user.last_name = user_data["last_name"] or ""
+            user_update_fields.append("last_name")
         if "email" in user_data:
             instance.user.email = user_data["email"]
-        instance.user.save()
+            user_update_fields.append("email")
+        if user_update_fields:
+            try:
+                with transaction.atomic():
+                    instance.user.save(update_fields=user_update_fields)
+            except IntegrityError:
+                raise serializers.ValidationError(
+                    {"email": ["This email is already in use."]})
 
-        for attr in ["location", "tel", "description", "working_hours"]:
+        profile_update_fields = []
+        for attr in _PROFILE_TEXT_FIELDS:
             if attr in validated_data:
                 setattr(instance, attr, validated_data[attr] or "")
+                profile_update_fields.append(attr)
 
         if "file" in validated_data:
             instance.file = validated_data["file"]
-        instance.save()
+            profile_update_fields.append("file")
+        if profile_update_fields:
+            instance.save(update_fields=profile_update_fields)
         return instance
 
 
@@ -93,6 +100,7 @@ class BusinessProfileListSerializer(serializers.ModelSerializer):
 
     - Returns basic public information about business profiles.
     - Ensures non-null fields by replacing None with empty strings.
+    - Builds the output dict directly instead of running each field, as the serializer is read-only.
     - Includes user identification and profile contact details.
     - Provides the image filename if available.
     """
@@ -116,12 +124,19 @@ class BusinessProfileListSerializer(serializers.ModelSerializer):
         ]
 
     def to_representation(self, instance):
-        data = super().to_representation(instance)
-        data["file"] = instance.file.name if instance.file else ""
-        for key in ["first_name", "last_name", "location", "tel", "description", "working_hours"]:
-            if data.get(key) in (None,):
-                data[key] = ""
-        return data
+        user = instance.user
+        return {
+            "user": user.id,
+            "username": user.username,
+            "first_name": user.first_name or "",
+            "last_name": user.last_name or "",
+            "file": instance.file.name if instance.file else "",
+            "location": instance.location or "",
+            "tel": instance.tel or "",
+            "description": instance.description or "",
+            "working_hours": instance.working_hours or "",
+            "type": instance.user_type,
+        }
 
 
 class CustomerProfileListSerializer(serializers.ModelSerializer):
@@ -131,6 +146,7 @@ class CustomerProfileListSerializer(serializers.ModelSerializer):
     - Provides public information about customer accounts.
     - Includes user identity fields, profile image, and upload timestamp.
     - Replaces None values with empty strings for consistent API responses.
+    - Builds the output dict directly instead of running each field, as the serializer is read-only.
     - Returns image filename if available.
     """
 
@@ -155,9 +171,13 @@ class CustomerProfileListSerializer(serializers.ModelSerializer):
         ]
 
     def to_representation(self, instance):
-        data = super().to_representation(instance)
-        data["file"] = instance.file.name if instance.file else ""
-        for key in ["first_name", "last_name", "location", "tel", "description", "working_hours"]:
-            if key in data and data.get(key) in (None,):
-                data[key] = ""
-        return data
+        user = instance.user
+        return {
+            "user": user.id,
+            "username": user.username,
+            "first_name": user.first_name or "",
+            "last_name": user.last_name or "",
+            "file": instance.file.name if instance.file else "",
+            "uploaded_at": format_datetime(instance.created_at),
+            "type": instance.user_type,
+        }
@@ -1,13 +1,17 @@
 from rest_framework import serializers
+from rest_framework.settings import api_settings
 from django.contrib.auth import get_user_model
+from django.db import transaction, IntegrityError
 from coderr_app.models import Review
+from ..utils import format_datetime
 
 User = get_user_model()
 
 
 class ReviewListSerializer(serializers.ModelSerializer):
     """
-    Serializer to present the needed informations about Reviews
+    Serializer to present the needed informations about Reviews.
+    Builds the output dict directly, as this serializer is read-only and used for whole lists.
     """
     class Meta:
         model = Review
@@ -22,29 +26,38 @@ class ReviewListSerializer(serializers.ModelSerializer):
 
         ]
 
+    def to_representation(self, instance):
+        return {
+            "id": instance.id,
+            "business_user": instance.business_user_id,
+            "reviewer": instance.reviewer_id,
+            "rating": instance.rating,
+            "description": instance.description,
+            "created_at": format_datetime(instance.created_at),
+            "updated_at": format_datetime(instance.updated_at),
+        }
+
 
 class ReviewCreateSerializer(serializers.ModelSerializer):
     """
     Serializer for creating new business user reviews.
 
-    - Ensures the target user has a 'business' profile type.
+    - Ensures the target user has a 'business' profile type within the field's own lookup query.
     - Prevents users from reviewing themselves.
-    - Enforces one review per reviewer-business pair.
+    - Enforces one review per reviewer-business pair via the model's unique constraint.
     - Automatically assigns the authenticated user as the reviewer.
     - Used for POST /api/reviews/ endpoint.
     """
 
+    business_user = serializers.PrimaryKeyRelatedField(
+        queryset=User.objects.filter(profile__user_type="business"),
+        error_messages={"does_not_exist": "Target user is not a business profile."},
+    )
+
     class Meta:
         model = Review
         fields = ["business_user", "rating", "description"]
 
-    def validate_business_user(self, value):
-
-        if not hasattr(value, "profile") or getattr(value.profile, "user_type", None) != "business":
-            raise serializers.ValidationError(
-                "Target user is not a business profile.")
-        return value
-
     def validate(self, attrs):
         reviewer = self.context["request"].user
         business_user = attrs.get("business_user")
@@ -52,16 +65,17 @@ class ReviewCreateSerializer(serializers.ModelSerializer):
         if business_user and reviewer and business_user.id == reviewer.id:
             raise serializers.ValidationError(
                 {"business_user": "You cannot review yourself."})
-
-        if business_user and Review.objects.filter(business_user=business_user, reviewer=reviewer).exists():
-            raise serializers.ValidationError(
-                "You have already reviewed this business user.")
         return attrs
 
     def create(self, validated_data):
         reviewer = validated_data.pop("reviewer", None)
 
-        return Review.objects.create(reviewer=reviewer, **validated_data)
+        try:
+            with transaction.atomic():
+                return Review.objects.create(reviewer=reviewer, **validated_data)
+        except IntegrityError:
+            raise serializers.ValidationError(
+                {api_settings.NON_FIELD_ERRORS_KEY: ["You have already reviewed this business user."]})
 
 
 class ReviewUpdateSerializer(serializers.ModelSerializer):
@@ -74,18 +88,19 @@ class ReviewUpdateSerializer(serializers.ModelSerializer):
     - Used for PATCH /api/reviews/{id}/ endpoint.
     """
 
+    _ALLOWED = frozenset({"rating", "description"})
+
     class Meta:
         model = Review
         fields = ["rating", "description"]
 
     def validate(self, attrs):
 
-        allowed = {"rating", "description"}
-        extra = set(self.initial_data.keys()) - allowed
+        extra = self.initial_data.keys() - self._ALLOWED
         if extra:
             raise serializers.ValidationError(
                 "Only 'rating' and 'description' may be updated.")
-        if not any(k in attrs for k in allowed):
+        if not (attrs.keys() & self._ALLOWED):
             raise serializers.ValidationError(
                 "Provide at least one of: 'rating' or 'description'.")
         return attrs
@@ -1,7 +1,8 @@
-from django.contrib import admin
 from django.urls import path, include
+from django.views.decorators.cache import cache_control, cache_page
 from rest_framework.routers import DefaultRouter
-from .views import ProfileView, BusinessProfileView, CustomerProfileView, OfferDetailItemView, OrderListCreateView, OrderDetailView, OrderCountView, CompletedOrderCountView,  BaseInfoView, OfferViewSet, ReviewViewSet
+from .utils import content_etag
+from .views import ProfileView, BusinessProfileView, CustomerProfileView, OfferDetailItemView, OfferDetailBulkView, OrderListCreateView, OrderDetailView, OrderCountView, CompletedOrderCountView,  BaseInfoView, OfferViewSet, ReviewViewSet
 
 router = DefaultRouter()
 router.register(r"offers", OfferViewSet, basename="offer")
@@ -15,7 +16,11 @@ urlpatterns = [
          name='business-profile-list'),
     path('profiles/customer/', CustomerProfileView.as_view(),
          name='customer-profile-list'),
-    path("offerdetails/<int:id>/", OfferDetailItemView.as_view(),
+    path("offerdetails/", OfferDetailBulkView.as_view(),
+         name="offer-detail-bulk"),
+    path("offerdetails/<int:id>/",
+         cache_control(private=True, max_age=60)(
+             OfferDetailItemView.as_view()),
          name="offer-detail-item"),
     path("orders/", OrderListCreateView.as_view(), name="order-list-create"),
     path("orders/<int:id>/", OrderDetailView.as_view(), name="order-detail"),
@@ -23,5 +28,8 @@ urlpatterns = [
          OrderCountView.as_view(), name="order-count"),
     path("completed-order-count/<int:business_user_id>/",
          CompletedOrderCountView.as_view(), name="completed-order-count"),
-    path("base-info/", BaseInfoView.as_view(), name="base-info"),
+    path("base-info/",
+         cache_control(public=True, max_age=60)(
+             content_etag(cache_page(60)(BaseInfoView.as_view()))),
+         name="base-info"),
 ]
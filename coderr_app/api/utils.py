@@ -0,0 +1,116 @@
+from functools import wraps
+from django.core.cache import cache
+from django.utils.cache import get_conditional_response, set_response_etag
+from django.db.models import Count, Q
+from rest_framework import serializers
+from coderr_app.models import Profile, Order
+
+
+USER_TYPE_CACHE_TIMEOUT = 60 * 60
+ORDER_COUNT_CACHE_TIMEOUT = 30
+
+_DATETIME_FIELD = serializers.DateTimeField()
+_PRICE_FIELD = serializers.DecimalField(max_digits=10, decimal_places=2)
+
+
+def content_etag(view_func):
+    """
+    Tags the rendered body of a GET response with an ETag and answers a matching If-None-Match with 304.
+
+    - Works on responses served by `cache_page` as well: those are already rendered DRF responses,
+      which Django's `conditional_page` would skip.
+    """
+    @wraps(view_func)
+    def wrapper(request, *args, **kwargs):
+        response = view_func(request, *args, **kwargs)
+        if request.method != "GET" or response.status_code != 200:
+            return response
+        if hasattr(response, "render"):
+            response.render()
+        if not response.has_header("ETag"):
+            set_response_etag(response)
+        return get_conditional_response(request, etag=response["ETag"], response=response)
+    return wrapper
+
+
+def get_base_uri(request):
+    """
+    Returns the scheme and host of the request (e.g. "http://127.0.0.1:8000") without a trailing slash.
+    """
+    return request.build_absolute_uri("/").rstrip("/")
+
+
+def build_absolute_url(context, path):
+    """
+    Turns a site-relative path into an absolute URL using the serializer context.
+
+    - Prefers the precomputed `_base_uri`, so the request is parsed only once per response.
+    - Falls back to `request.build_absolute_uri` or the plain path if no request is available.
+    - Leaves paths that are already absolute URLs untouched.
+    """
+    base = context.get("_base_uri")
+    if base is not None:
+        return f"{base}{path}" if path.startswith("/") else path
+    request = context.get("request")
+    return request.build_absolute_uri(path) if request else path
+
+
+def format_datetime(value):
+    """
+    Formats a datetime exactly like a DRF DateTimeField would, without binding a field per row.
+    """
+    return _DATETIME_FIELD.to_representation(value) if value is not None else None
+
+
+def format_price(value):
+    """
+    Formats a price exactly like a DRF DecimalField(max_digits=10, decimal_places=2) would.
+    """
+    return _PRICE_FIELD.to_representation(value) if value is not None else None
+
+
+def user_type_cache_key(user_id):
+    return f"user_type:{user_id}"
+
+
+def get_user_type(user_id):
+    """
+    Returns the profile type ('customer' or 'business') of a user, or None if the user has no profile.
+
+    - Served from the cache; profile saves and deletes invalidate the entry (see coderr_app.signals).
+    - Misses are not cached, so a profile created later is seen right away.
+    """
+    key = user_type_cache_key(user_id)
+    user_type = cache.get(key)
+    if user_type is None:
+        user_type = Profile.objects.filter(user_id=user_id).values_list(
+            "user_type", flat=True).first()
+        if user_type is not None:
+            cache.set(key, user_type, USER_TYPE_CACHE_TIMEOUT)
+    return user_type
+
+
+def order_count_cache_key(business_user_id, status):
+    return f"order_count:{business_user_id}:{status}"
+
+
+def get_order_count(business_user_id, status):
+    """
+    Returns the number of orders with the given status for a business user.
+
+    - Served from the cache for ORDER_COUNT_CACHE_TIMEOUT seconds, as dashboards poll these counters.
+    - A miss counts every status in one conditional aggregate and caches all of them, so the
+      in-progress and completed endpoints share a single query.
+    - Order saves and deletes invalidate the entries of the affected business user (see coderr_app.signals).
+    """
+    key = order_count_cache_key(business_user_id, status)
+    count = cache.get(key)
+    if count is None:
+        counts = Order.objects.filter(business_user_id=business_user_id).aggregate(**{
+            s: Count("id", filter=Q(status=s)) for s, _ in Order.STATUS_CHOICES
+        })
+        cache.set_many(
+            {order_count_cache_key(business_user_id, s): c for s, c in counts.items()},
+            ORDER_COUNT_CACHE_TIMEOUT)
+        count = counts.get(status, 0)
+    return count
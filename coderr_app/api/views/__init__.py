@@ -2,7 +2,8 @@ from .offerviews import (
 
     OfferFilter,
     OfferDetailItemView,
-    OfferViewSet
+    OfferDetailBulkView,
+    OfferViewSet,
 
 )
 
@@ -34,6 +35,7 @@ __all__ = [
 
     "OfferFilter",
     "OfferDetailItemView",
+    "OfferDetailBulkView",
     "OrderListCreateView",
     "OrderDetailView",
     "OrderCountView",
@@ -1,15 +1,24 @@
+import hashlib
+from functools import lru_cache
+from django.http import Http404
+from django.shortcuts import get_object_or_404
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
 from rest_framework import generics, status, permissions, viewsets
 from coderr_app.models import Offer, OfferDetail
 from ..serializers import OfferListSerializer, OfferCreateSerializer, OfferRetrieveSerializer, OfferUpdateSerializer, OfferDetailRetrieveSerializer
 from rest_framework.response import Response
-from django.db.models import Min
-from ..pagination import OfferListPagination
+from rest_framework.exceptions import ValidationError
+from django.db.models import Prefetch
+from ..pagination import OfferListPagination, OfferCursorPagination, CursorOptInMixin
 from ..permissions import IsBusinessUser
+from ..utils import get_base_uri
+from ..filters import CachedFormFilterSet
 from django_filters import rest_framework as filters
 from rest_framework.parsers import JSONParser, MultiPartParser, FormParser
 
 
-class OfferFilter(filters.FilterSet):
+class OfferFilter(CachedFormFilterSet):
     """
     FilterSet for filtering offers based on creator, price, and delivery time.
 
@@ -20,21 +29,16 @@ class OfferFilter(filters.FilterSet):
     """
 
     creator_id = filters.NumberFilter(field_name="user_id")
-    min_price = filters.NumberFilter(method="filter_min_price")
-    max_delivery_time = filters.NumberFilter(method="filter_max_delivery")
+    min_price = filters.NumberFilter(field_name="min_price", lookup_expr="gte")
+    max_delivery_time = filters.NumberFilter(
+        field_name="min_delivery_time", lookup_expr="lte")
 
     class Meta:
         model = Offer
-        fields = ["creator_id"]
+        fields = ["creator_id", "min_price", "max_delivery_time"]
 
-    def filter_min_price(self, queryset, name, value):
-        return queryset.filter(mind_price__gte=value)
 
-    def filter_max_delivery(self, queryset, name, value):
-        return queryset.filter(min_delivery_time__lte=value)
-
-
-class OfferViewSet(viewsets.ModelViewSet):
+class OfferViewSet(CursorOptInMixin, viewsets.ModelViewSet):
     """
     A CRUD ViewSet for the OFFER-Model. Gives correct permissions and serializers due to the Method which is used on the Endpoint
 
@@ -43,38 +47,50 @@ class OfferViewSet(viewsets.ModelViewSet):
         - create => POST /offers/
         - update => PUT/PATCH /offers/{id}/
         - destroy => DELETE /offers/{id}/
+
+    Listing uses page numbers by default; passing a `cursor` query parameter (empty for the first page)
+    switches to keyset pagination.
     """
 
     lookup_field = "id"
     parser_classes = (JSONParser, MultiPartParser, FormParser)
     pagination_class = OfferListPagination
+    cursor_pagination_class = OfferCursorPagination
     filterset_class = OfferFilter
     search_fields = ["title", "description"]
     ordering_fields = ["updated_at", "min_price"]
-    ordering = ["-updated_at"]
+    ordering = ["-updated_at", "-id"]
 
     def get_queryset(self):
 
         return (
             Offer.objects
             .select_related("user")
-            .prefetch_related("details")
-            .annotate(
-                min_price=Min("details__price"),
-                min_delivery_time=Min("details__delivery_time"),
+            .only(
+                "id", "user", "title", "image", "description", "created_at", "updated_at",
+                "min_price", "min_delivery_time",
+                "user__id", "user__username", "user__first_name", "user__last_name",
             )
+            .prefetch_related(Prefetch(
+                "details",
+                queryset=OfferDetail.objects.only("id", "offer_id"),
+            ))
         )
 
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context["_base_uri"] = get_base_uri(self.request)
+        return context
+
+    _ACTION_PERMISSIONS = {
+        "list": (),
+        "create": (permissions.IsAuthenticated, IsBusinessUser),
+    }
+
     def get_permissions(self):
-        if self.action == "list":
-            return []
-        if self.action == "retrieve":
-            return [permissions.IsAuthenticated()]
-        if self.action == "create":
-            return [permissions.IsAuthenticated(), IsBusinessUser()]
-        if self.action in ("update", "partial_update", "destroy"):
-            return [permissions.IsAuthenticated()]
-        return [permissions.IsAuthenticated()]
+        perms = self._ACTION_PERMISSIONS.get(
+            self.action, (permissions.IsAuthenticated,))
+        return [perm() for perm in perms]
 
     def get_serializer_class(self):
         if self.action == "list":
@@ -116,6 +132,10 @@ class OfferDetailItemView(generics.RetrieveAPIView):
     - GET: Returns detailed information about a specific OfferDetail.
     - Accessible only to authenticated users.
     - Uses OfferDetailRetrieveSerializer for structured output.
+    - Serialized details are kept in a per-process LRU cache keyed by the parent offer's `updated_at`,
+      which every detail write bumps, so entries of other workers never go stale.
+    - Sends an ETag and answers a matching If-None-Match with 304; this runs inside the view,
+      so authentication and permissions are checked first.
     - Used for /api/offerdetails/{id}/ endpoint.
     """
 
@@ -126,3 +146,79 @@ class OfferDetailItemView(generics.RetrieveAPIView):
 
     def get_queryset(self):
         return OfferDetail.objects.all()
+
+    def retrieve(self, request, *args, **kwargs):
+        detail_id = kwargs[self.lookup_url_kwarg]
+        updated_at = _offer_updated_at(detail_id)
+        if updated_at is None:
+            raise Http404
+        etag = _offer_detail_etag(detail_id, updated_at)
+        not_modified = get_conditional_response(request, etag=etag)
+        if not_modified is not None:
+            return not_modified
+        response = Response(serialize_offer_detail(detail_id, updated_at.timestamp()))
+        response["ETag"] = etag
+        return response
+
+
+class OfferDetailBulkView(generics.ListAPIView):
+    """
+    API view for retrieving several offer details in one request.
+
+    - GET: Returns the OfferDetails listed in `ids` (comma-separated or repeated, max 50), ordered by id.
+    - Unknown ids are skipped; a missing, malformed or too long id list responds with 400.
+    - Accessible only to authenticated users.
+    - Uses OfferDetailRetrieveSerializer, so items match GET /api/offerdetails/{id}/.
+    - Used for /api/offerdetails/?ids=1,2,3 endpoint.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+    serializer_class = OfferDetailRetrieveSerializer
+    pagination_class = None
+    filter_backends = []
+    max_ids = 50
+
+    def get_queryset(self):
+        raw = ",".join(self.request.query_params.getlist("ids"))
+        try:
+            ids = {int(i) for i in raw.split(",") if i.strip()}
+        except ValueError:
+            raise ValidationError(
+                {"ids": "Provide a comma-separated list of integer ids."})
+        if not ids:
+            raise ValidationError({"ids": "This query parameter is required."})
+        if len(ids) > self.max_ids:
+            raise ValidationError(
+                {"ids": f"At most {self.max_ids} ids may be requested at once."})
+        return (
+            OfferDetail.objects
+            .filter(id__in=ids)
+            .only("id", "title", "revisions", "delivery_time", "price", "features", "offer_type")
+            .order_by("id")
+        )
+
+
+def _offer_updated_at(detail_id):
+    return OfferDetail.objects.filter(id=detail_id).values_list("offer__updated_at", flat=True).first()
+
+
+@lru_cache(maxsize=1024)
+def serialize_offer_detail(detail_id, offer_updated_ts):
+    """
+    Returns the serialized OfferDetail; `offer_updated_ts` is part of the cache key so offer updates miss the cache.
+    Every detail write bumps the parent offer's `updated_at`: OfferUpdateSerializer saves the offer before
+    its bulk_update, and single-row OfferDetail saves and deletes touch it in a signal (see coderr_app.signals).
+    Raises Http404 if the detail was deleted after its offer's `updated_at` was read.
+    """
+    detail = get_object_or_404(OfferDetail.objects.only(
+        "id", "title", "revisions", "delivery_time", "price", "features", "offer_type"), pk=detail_id)
+    return OfferDetailRetrieveSerializer(detail).data
+
+
+def _offer_detail_etag(detail_id, updated_at):
+    """
+    Computes the quoted ETag of an offer detail from the parent offer's `updated_at`.
+    Changes with every detail write, as those bump `updated_at` (see serialize_offer_detail).
+    """
+    digest = hashlib.md5(f"{updated_at.timestamp()}:{detail_id}".encode(), usedforsecurity=False)
+    return quote_etag(digest.hexdigest())
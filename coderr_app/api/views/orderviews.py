@@ -3,9 +3,10 @@ from coderr_app.models import Order
 from ..serializers import OrderListSerializer, OrderCreateSerializer, OrderStatusUpdateSerializer
 from rest_framework.response import Response
 from django.db.models import Q
-from ..permissions import IsCustomerUser
+from ..permissions import IsCustomerUser, get_request_user_type
 from rest_framework.views import APIView
-from django.contrib.auth import get_user_model
+from ..utils import get_user_type, get_order_count
+from ..pagination import OptionalPageNumberPagination
 
 
 class OrderListCreateView(generics.ListCreateAPIView):
@@ -15,6 +16,7 @@ class OrderListCreateView(generics.ListCreateAPIView):
     - GET: Returns all orders related to the authenticated user (as customer or business).
       Supports optional filtering by business_user_id, customer_user_id, and status.
       Staff users can view all orders.
+      Returns a plain list unless `page_size` is given, which paginates the result.
     - POST: Allows only authenticated customers to create new orders based on OfferDetails.
     - Enforces role-based permissions and context-aware filtering.
     - Used for /api/orders/ endpoint.
@@ -22,30 +24,19 @@ class OrderListCreateView(generics.ListCreateAPIView):
 
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = OrderListSerializer
-    pagination_class = None
+    pagination_class = OptionalPageNumberPagination
 
     def get_queryset(self):
         u = self.request.user
-        qs = Order.objects.all()
-        business_user_id = self.request.query_params.get("business_user_id")
-        customer_user_id = self.request.query_params.get("customer_user_id")
-        status_param = self.request.query_params.get("status")
-
-        if business_user_id:
-            qs = qs.filter(business_user_id=business_user_id)
-        if customer_user_id:
-            qs = qs.filter(customer_user_id=customer_user_id)
-        if status_param:
-            qs = qs.filter(status=status_param)
+        params = self.request.query_params
+        qs = Order.objects.filter(**{
+            param: params[param]
+            for param in ("business_user_id", "customer_user_id", "status")
+            if params.get(param)
+        })
 
         if not u.is_staff:
-            allowed = Q(customer_user=u) | Q(business_user=u)
-            if business_user_id and business_user_id.isdigit() and int(business_user_id) == u.id:
-                pass
-            elif customer_user_id and customer_user_id.isdigit() and int(customer_user_id) == u.id:
-                pass
-            else:
-                qs = qs.filter(allowed)
+            qs = qs.filter(Q(customer_user_id=u.id) | Q(business_user_id=u.id))
 
         return qs.order_by("-created_at")
 
@@ -74,6 +65,7 @@ class OrderDetailView(generics.RetrieveUpdateDestroyAPIView):
     API view for retrieving, updating, and deleting specific orders.
 
     - GET: Returns a specific order if the authenticated user is the customer or business user.
+      Staff users can access all orders; for everyone else, other orders respond with 404.
     - PATCH: Allows only the assigned business user to update the order status.
     - DELETE: Only staff (admin) users can delete an order.
     - Uses dynamic serializer selection depending on the request method.
@@ -86,7 +78,9 @@ class OrderDetailView(generics.RetrieveUpdateDestroyAPIView):
 
     def get_queryset(self):
         u = self.request.user
-        return Order.objects.filter(Q(customer_user=u) | Q(business_user=u) | Q(id__isnull=False))
+        if u.is_staff:
+            return Order.objects.all()
+        return Order.objects.filter(Q(customer_user=u) | Q(business_user=u))
 
     def get_serializer_class(self):
         if self.request.method == "PATCH":
@@ -96,9 +90,8 @@ class OrderDetailView(generics.RetrieveUpdateDestroyAPIView):
     def patch(self, request, *args, **kwargs):
         order = self.get_object()
 
-        if not (hasattr(request.user, "profile")
-                and request.user.profile.user_type == "business"
-                and request.user.id == order.business_user_id):
+        if not (request.user.id == order.business_user_id
+                and get_request_user_type(request) == "business"):
             return Response({"detail": "You do not have permission to perforn this action"}, status=status.HTTP_403_FORBIDDEN)
 
         return super().patch(request, *args, **kwargs)
@@ -117,8 +110,9 @@ class OrderCountView(APIView):
     API view that returns the number of active ('in_progress') orders for a specific business user.
 
     - GET: Retrieves the count of all ongoing orders associated with the given business user ID.
-    - Validates that the user exists and has a business profile.
+    - Validates that the user has a business profile via the cached user type, without loading the user row.
     - Returns a 404 response if the user is not found or is not a business profile.
+    - The count is cached briefly and invalidated whenever one of the user's orders changes.
     - Endpoint: /api/order-count/{business_user_id}/
     - Permissions: Requires authentication.
     """
@@ -126,18 +120,10 @@ class OrderCountView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request, business_user_id: int):
-        User = get_user_model()
-        try:
-            user = User.objects.select_related(
-                "profile").get(pk=business_user_id)
-        except User.DoesNotExist:
+        if get_user_type(business_user_id) != "business":
             return Response({"detail": "Business user not found"}, status=status.HTTP_404_NOT_FOUND)
 
-        if not hasattr(user, "profile") or getattr(user.profile, "user_type", None) != "business":
-            return Response({"detail": "Business user not found"}, status=status.HTTP_404_NOT_FOUND)
-
-        count = Order.objects.filter(
-            business_user_id=user.id, status="in_progress").count()
+        count = get_order_count(business_user_id, "in_progress")
         return Response({"order_count": count}, status=status.HTTP_200_OK)
 
 
@@ -146,8 +132,9 @@ class CompletedOrderCountView(APIView):
     API view that returns the number of completed ('completed') orders for a specific business user.
 
     - GET: Retrieves the count of all completed orders associated with the given business user ID.
-    - Validates that the user exists and has a business profile.
+    - Validates that the user has a business profile via the cached user type, without loading the user row.
     - Returns a 404 response if the user is not found or is not a business profile.
+    - The count is cached briefly and invalidated whenever one of the user's orders changes.
     - Endpoint: /api/completed-order-count/{business_user_id}/
     - Permissions: Requires authentication.
     """
@@ -155,16 +142,8 @@ class CompletedOrderCountView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request, business_user_id: int):
-        User = get_user_model()
-        try:
-            user = User.objects.select_related(
-                "profile").get(pk=business_user_id)
-        except User.DoesNotExist:
-            return Response({"detail": "Business user not found"}, status=status.HTTP_404_NOT_FOUND)
-
-        if not hasattr(user, "profile") or getattr(user.profile, "user_type", None) != "business":
+        if get_user_type(business_user_id) != "business":
             return Response({"detail": "Business user not found"}, status=status.HTTP_404_NOT_FOUND)
 
-        count = Order.objects.filter(
-            business_user_id=user.id, status="completed").count()
+        count = get_order_count(business_user_id, "completed")
         return Response({"completed_order_count": count}, status=status.HTTP_200_OK)
@@ -4,6 +4,12 @@ from coderr_app.models import Profile
 from ..serializers import ProfileSerializer, BusinessProfileListSerializer, CustomerProfileListSerializer
 from rest_framework.response import Response
 from rest_framework.parsers import JSONParser, MultiPartParser, FormParser
+from ..utils import get_base_uri
+from ..pagination import OptionalPageNumberPagination
+
+
+_LIST_USER_FIELDS = ("user__id", "user__username",
+                     "user__first_name", "user__last_name")
 
 
 class ProfileView(generics.RetrieveUpdateAPIView):
@@ -20,9 +26,17 @@ class ProfileView(generics.RetrieveUpdateAPIView):
     serializer_class = ProfileSerializer
     parser_classes = [JSONParser, MultiPartParser, FormParser]
 
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context["_base_uri"] = get_base_uri(self.request)
+        return context
+
     def get_object(self):
         user_id = self.kwargs['pk']
-        return get_object_or_404(Profile.objects.select_related("user"), user__id=user_id)
+        queryset = Profile.objects.select_related("user").only(
+            "id", "user_id", "user_type", "file", "location", "tel", "description",
+            "working_hours", "created_at", *_LIST_USER_FIELDS, "user__email")
+        return get_object_or_404(queryset, user__id=user_id)
 
     def patch(self, request, *args, **kwargs):
         obj = self.get_object()
@@ -38,18 +52,21 @@ class BusinessProfileView(generics.ListAPIView):
     - Accessible only to authenticated users.
     - Returns profiles where `user_type` is 'business'.
     - Orders results alphabetically by username.
+    - Loads only the columns the list serializer renders.
     - Used for GET /api/profiles/business/ endpoint.
     """
 
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = BusinessProfileListSerializer
+    pagination_class = OptionalPageNumberPagination
 
     def get_queryset(self):
         return (Profile.objects
                 .select_related("user")
                 .filter(user_type='business')
+                .only("id", "user_id", "user_type", "file", "location", "tel",
+                      "description", "working_hours", *_LIST_USER_FIELDS)
                 .order_by('user__username')
-
                 )
 
 
@@ -60,14 +77,18 @@ class CustomerProfileView(generics.ListAPIView):
     - Accesible only to authenticated users.
     - Returns profiles where 'user-type' is customer.
     - Orders result alphabetically by username as default.
+    - Loads only the columns the list serializer renders.
     - Used for GET /api/profiles/customer/ endpoint.
     """
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = CustomerProfileListSerializer
+    pagination_class = OptionalPageNumberPagination
 
     def get_queryset(self):
         return (Profile.objects
                 .select_related("user")
                 .filter(user_type='customer')
+                .only("id", "user_id", "user_type", "file", "created_at",
+                      *_LIST_USER_FIELDS)
                 .order_by('user__username')
                 )
@@ -2,13 +2,14 @@ from rest_framework import generics, status, permissions, viewsets
 from coderr_app.models import Profile, Offer, Review
 from ..serializers import ReviewListSerializer, ReviewCreateSerializer, ReviewUpdateSerializer
 from rest_framework.response import Response
-from django.db.models import Avg
-from ..permissions import IsCustomerUser
+from django.db.models import Avg, Count
+from ..permissions import IsCustomerUser, IsReviewer
 from rest_framework.views import APIView
 from ..filters import ReviewFilter
+from ..pagination import OptionalPageNumberPagination, ReviewCursorPagination, CursorOptInMixin
 
 
-class ReviewViewSet(viewsets.ModelViewSet):
+class ReviewViewSet(CursorOptInMixin, viewsets.ModelViewSet):
     """
     CRUD ViewSet for the REVIEW-Model with appropriate permissions and serializers based on the action.:
 
@@ -18,25 +19,35 @@ class ReviewViewSet(viewsets.ModelViewSet):
     - update      PUT    /reviews/{id}/
     - partial     PATCH  /reviews/{id}/
     - destroy     DELETE /reviews/{id}/
+
+    The serializers only read the user foreign key ids, so the user tables are not joined.
+    Listing returns a plain list unless `page_size` is given; passing a `cursor` query parameter
+    (empty for the first page) switches to keyset pagination without a COUNT query.
     """
-    queryset = (
-        Review.objects
-        .select_related("business_user", "reviewer",)
-    )
     lookup_field = "id"
     ordering_fields = ["updated_at", "rating", "id", "created_at"]
-    ordering = ["-updated_at",]
+    ordering = ["-updated_at", "-id"]
     filterset_class = ReviewFilter
     serializer_class = ReviewListSerializer
+    pagination_class = OptionalPageNumberPagination
+    cursor_pagination_class = ReviewCursorPagination
+
+    def get_queryset(self):
+        return Review.objects.all()
+
+    _ACTION_PERMISSIONS = {
+        "list": (permissions.AllowAny,),
+        "retrieve": (permissions.AllowAny,),
+        "create": (permissions.IsAuthenticated, IsCustomerUser),
+        "update": (permissions.IsAuthenticated, IsReviewer),
+        "partial_update": (permissions.IsAuthenticated, IsReviewer),
+        "destroy": (permissions.IsAuthenticated, IsReviewer),
+    }
 
     def get_permissions(self):
-        if self.action in ("list", "retrieve"):
-            return [permissions.AllowAny()]
-        if self.action == "create":
-            return [permissions.IsAuthenticated(), IsCustomerUser()]
-        if self.action in ("update", "partial_update", "destroy"):
-            return [permissions.IsAuthenticated()]
-        return [permissions.IsAuthenticated()]
+        perms = self._ACTION_PERMISSIONS.get(
+            self.action, (permissions.IsAuthenticated,))
+        return [perm() for perm in perms]
 
     def get_serializer_class(self):
         if self.action == "list" or self.action == "retrieve":
@@ -50,33 +61,6 @@ class ReviewViewSet(viewsets.ModelViewSet):
     def perform_create(self, serializer):
         serializer.save(reviewer=self.request.user)
 
-    def update(self, request, *args, **kwargs):
-        review = self.get_object()
-        if request.user.id != review.reviewer_id:
-            return Response(
-                {"detail": "You do not have permission to perform this action."},
-                status=status.HTTP_403_FORBIDDEN,
-            )
-        return super().update(request, *args, **kwargs)
-
-    def partial_update(self, request, *args, **kwargs):
-        review = self.get_object()
-        if request.user.id != review.reviewer_id:
-            return Response(
-                {"detail": "You do not have permission to perform this action."},
-                status=status.HTTP_403_FORBIDDEN,
-            )
-        return super().partial_update(request, *args, **kwargs)
-
-    def destroy(self, request, *args, **kwargs):
-        review = self.get_object()
-        if request.user.id != review.reviewer_id:
-            return Response(
-                {"detail": "You do not have permission to perform this action."},
-                status=status.HTTP_403_FORBIDDEN,
-            )
-        return super().destroy(request, *args, **kwargs)
-
 
 class BaseInfoView(APIView):
     """
@@ -90,6 +74,7 @@ class BaseInfoView(APIView):
 
     Methods:
         GET: Returns a JSON object with aggregated platform data.
+             The rendered response is cached for 60 seconds and tagged with an ETag of its bytes (see urls.py).
 
     Permissions:
         - Public endpoint (no authentication required).
@@ -97,18 +82,20 @@ class BaseInfoView(APIView):
     permission_classes = []
 
     def get(self, request):
-        review_count = Review.objects.count()
-        avg = Review.objects.aggregate(avg=Avg("rating"))["avg"]
-        average_rating = round(float(avg), 1) if avg is not None else 0.0
-
-        business_profile_count = Profile.objects.filter(
-            user_type="business").count()
-        offer_count = Offer.objects.count()
-
-        data = {
-            "review_count": review_count,
-            "average_rating": average_rating,
-            "business_profile_count": business_profile_count,
-            "offer_count": offer_count,
-        }
-        return Response(data, status=status.HTTP_200_OK)
+        return Response(get_base_info(), status=status.HTTP_200_OK)
+
+
+def get_base_info():
+    """
+    Computes the base-info payload. The rendered response is cached by `cache_page` in urls.py.
+    """
+    reviews = Review.objects.aggregate(
+        cnt=Count("id"), avg=Avg("rating"))
+    avg = reviews["avg"]
+    return {
+        "review_count": reviews["cnt"],
+        "average_rating": round(float(avg), 1) if avg is not None else 0.0,
+        "business_profile_count": Profile.objects.filter(
+            user_type="business").count(),
+        "offer_count": Offer.objects.count(),
+    }
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.7 on 2026-10-14 05:55
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('coderr_app', '0011_alter_review_rating_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='offer',
+            index=models.Index(fields=['-updated_at', '-id'], name='coderr_app__updated_57d15c_idx'),
+        ),
+    ]
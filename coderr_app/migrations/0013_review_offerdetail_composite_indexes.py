@@ -0,0 +1,39 @@
+# Generated by Django 5.2.7 on 2026-10-14 05:58
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('coderr_app', '0012_offer_updated_at_id_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='review',
+            name='coderr_app__busines_b06adc_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='review',
+            name='coderr_app__reviewe_346d77_idx',
+        ),
+        migrations.AddIndex(
+            model_name='offerdetail',
+            index=models.Index(fields=['offer', 'price'], name='coderr_app__offer_i_75bf7c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='offerdetail',
+            index=models.Index(fields=['offer', 'delivery_time'], name='coderr_app__offer_i_9e7f1a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['business_user', '-updated_at'], name='coderr_app__busines_8fe985_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['reviewer', '-updated_at'], name='coderr_app__reviewe_f1b914_idx'),
+        ),
+    ]
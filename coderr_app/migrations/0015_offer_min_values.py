@@ -0,0 +1,41 @@
+# Generated by Django 5.2.7 on 2026-10-14 06:24
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Min, OuterRef, Subquery
+
+
+def populate_min_values(apps, schema_editor):
+    Offer = apps.get_model('coderr_app', 'Offer')
+    OfferDetail = apps.get_model('coderr_app', 'OfferDetail')
+    details = OfferDetail.objects.filter(offer_id=OuterRef('pk')).values('offer_id')
+    Offer.objects.update(
+        min_price=Subquery(details.annotate(v=Min('price')).values('v')),
+        min_delivery_time=Subquery(details.annotate(v=Min('delivery_time')).values('v')),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('coderr_app', '0014_order_user_status_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='offer',
+            name='min_delivery_time',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='offer',
+            name='min_price',
+            field=models.DecimalField(blank=True, decimal_places=2, editable=False, max_digits=10, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='offer',
+            index=models.Index(fields=['min_price'], name='coderr_app__min_pri_31d6b3_idx'),
+        ),
+        migrations.RunPython(populate_min_values, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.7 on 2026-10-14 06:36
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('coderr_app', '0015_offer_min_values'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='profile',
+            index=models.Index(fields=['user_type'], name='coderr_app__user_ty_45b122_idx'),
+        ),
+    ]
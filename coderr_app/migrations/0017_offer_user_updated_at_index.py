@@ -0,0 +1,19 @@
+# Generated by Django 5.2.7 on 2026-10-14 06:43
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('coderr_app', '0016_profile_user_type_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='offer',
+            index=models.Index(fields=['user', '-updated_at'], name='coderr_app__user_id_37a564_idx'),
+        ),
+    ]
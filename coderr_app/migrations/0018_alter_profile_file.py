@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-14 06:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('coderr_app', '0017_offer_user_updated_at_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='profile',
+            name='file',
+            field=models.ImageField(blank=True, null=True, upload_to='profiles/'),
+        ),
+    ]
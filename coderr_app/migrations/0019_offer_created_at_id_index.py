@@ -0,0 +1,19 @@
+# Generated by Django 5.2.7 on 2026-10-14 06:59
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('coderr_app', '0018_alter_profile_file'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='offer',
+            index=models.Index(fields=['-created_at', '-id'], name='coderr_app__created_9cbc9f_idx'),
+        ),
+    ]
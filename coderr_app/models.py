@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models import Min
 from django.conf import settings
 from django.utils import timezone
 from django.core.validators import MinValueValidator, MaxValueValidator
@@ -27,6 +28,11 @@ class Profile(models.Model):
     working_hours = models.CharField(max_length=255, blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["user_type"]),
+        ]
+
     def __str__(self):
         return f"{self.user.username} ({self.user_type})"
 
@@ -42,10 +48,44 @@ class Offer(models.Model):
     description = models.TextField(blank=True, default='')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    min_price = models.DecimalField(
+        max_digits=10, decimal_places=2, null=True, blank=True, editable=False)
+    min_delivery_time = models.PositiveIntegerField(
+        null=True, blank=True, editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["-updated_at", "-id"]),
+            models.Index(fields=["-created_at", "-id"]),
+            models.Index(fields=["user", "-updated_at"]),
+            models.Index(fields=["min_price"]),
+        ]
 
     def __str__(self):
         return f"{self.title} by {self.user.username}"
 
+    @classmethod
+    def refresh_min_values(cls, offer_id, touch=False):
+        """
+        Recomputes the denormalized `min_price` and `min_delivery_time` of an offer from its details.
+        Writes through a queryset update, so `updated_at` is left untouched unless `touch` is set.
+        Returns both values.
+        """
+        agg = OfferDetail.objects.filter(offer_id=offer_id).aggregate(
+            price=Min("price"), delivery_time=Min("delivery_time"))
+        changes = {"min_price": agg["price"], "min_delivery_time": agg["delivery_time"]}
+        if touch:
+            changes["updated_at"] = timezone.now()
+        cls.objects.filter(pk=offer_id).update(**changes)
+        return agg["price"], agg["delivery_time"]
+
+    @property
+    def details_urls(self):
+        """
+        Returns id and relative API path of every detail; uses the prefetch cache when available.
+        """
+        return [{"id": d.id, "url": d.url_path} for d in self.details.all()]
+
 
 class OfferDetail(models.Model):
     """
@@ -62,9 +102,19 @@ class OfferDetail(models.Model):
     features = models.JSONField(default=list, blank=True)
     offer_type = models.CharField(max_length=20, choices=OFFER_TYPE_CHOICES)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["offer", "price"]),
+            models.Index(fields=["offer", "delivery_time"]),
+        ]
+
     def __str__(self):
         return f"{self.title} (offer{self.offer_id})"
 
+    @property
+    def url_path(self):
+        return f"/offerdetails/{self.id}/"
+
 
 class Order(models.Model):
     """
@@ -102,6 +152,12 @@ class Order(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["business_user", "status"]),
+            models.Index(fields=["customer_user", "status"]),
+        ]
+
     def __str__(self):
         return f"Order {self.id}: {self.title} ({self.customer_user_id} -> {self.business_user_id})"
 
@@ -129,10 +185,11 @@ class Review(models.Model):
                 fields=["business_user", "reviewer"], name="uniq_review_per_business_per_reviewer")
         ]
         indexes = [
-            models.Index(fields=["business_user"]),
-            models.Index(fields=["reviewer"]),
+            models.Index(fields=["business_user", "-updated_at"]),
+            models.Index(fields=["reviewer", "-updated_at"]),
             models.Index(fields=["rating"]),
             models.Index(fields=["-updated_at"]),
+            models.Index(fields=["-created_at", "-id"]),
         ]
 
     def __str__(self):
@@ -0,0 +1,67 @@
+import threading
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .models import Profile, Offer, OfferDetail, Order
+from .api.utils import user_type_cache_key, order_count_cache_key
+
+
+_pending = threading.local()
+
+
+def _flush_pending_cache_keys():
+    keys = getattr(_pending, "keys", None)
+    if keys:
+        _pending.keys = set()
+        cache.delete_many(keys)
+
+
+def delete_cache_keys_on_commit(keys):
+    """
+    Queues cache keys for deletion once the current transaction commits.
+
+    Keys from all writes of one transaction are collected per thread and removed with a single
+    delete_many by the first callback that runs; later callbacks find nothing left to do.
+    Outside a transaction the keys are deleted immediately. Keys queued by a rolled back
+    transaction are removed with the next flush, which only costs a redundant delete.
+    """
+    if not hasattr(_pending, "keys"):
+        _pending.keys = set()
+    _pending.keys.update(keys)
+    transaction.on_commit(_flush_pending_cache_keys)
+
+
+@receiver(post_save, sender=Profile)
+@receiver(post_delete, sender=Profile)
+def invalidate_user_type(sender, instance, **kwargs):
+    """
+    Drops the cached profile type of the affected user once a profile save or delete is committed.
+    """
+    delete_cache_keys_on_commit([user_type_cache_key(instance.user_id)])
+
+
+@receiver(post_save, sender=Order)
+@receiver(post_delete, sender=Order)
+def invalidate_order_counts(sender, instance, **kwargs):
+    """
+    Drops the cached order counts of the business user once a save or delete of one of their orders is committed.
+    """
+    delete_cache_keys_on_commit(
+        order_count_cache_key(instance.business_user_id, status)
+        for status, _ in Order.STATUS_CHOICES
+    )
+
+
+@receiver(post_save, sender=OfferDetail)
+@receiver(post_delete, sender=OfferDetail)
+def refresh_offer_min_values(sender, instance, **kwargs):
+    """
+    Keeps the denormalized minimum price and delivery time of the parent offer in sync
+    when a single detail is written or removed, and bumps the offer's `updated_at`, which keys
+    the offer detail cache and ETag. Skipped while the offer itself is being deleted.
+    Bulk writes in the offer serializers update these values themselves.
+    """
+    if isinstance(kwargs.get("origin"), Offer):
+        return
+    Offer.refresh_min_values(instance.offer_id, touch=True)
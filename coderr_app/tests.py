@@ -1,3 +1,314 @@
-from django.test import TestCase
+from decimal import Decimal
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.http import Http404
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+from coderr_app.api.fields import Base64ImageField
+from coderr_app.api.views.offerviews import serialize_offer_detail
+from coderr_app.models import OfferDetail, Profile, Review
 
-# Create your tests here.
+User = get_user_model()
+
+
+def offer_details():
+    return [
+        {"title": f"Detail {offer_type}", "revisions": i, "delivery_time_in_days": 3 + i,
+         "price": f"{100 + i}.00", "features": ["a"], "offer_type": offer_type}
+        for i, offer_type in enumerate(("basic", "standard", "premium"))
+    ]
+
+
+class CoderrAPITestCase(APITestCase):
+    """
+    Shared fixtures: two business users, one customer and a clean cache for every test.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.business = self.create_user("business", "business")
+        self.other_business = self.create_user("business2", "business")
+        self.customer = self.create_user("customer", "customer")
+
+    def create_user(self, username, user_type):
+        user = User.objects.create_user(
+            username, f"{username}@example.com", "pass12345")
+        Profile.objects.create(user=user, user_type=user_type)
+        return user
+
+    def authenticate(self, user):
+        token, _ = Token.objects.get_or_create(user=user)
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + token.key)
+
+    def create_offer(self, user=None, title="Offer"):
+        self.authenticate(user or self.business)
+        response = self.client.post(
+            "/api/offers/", {"title": title, "description": "", "details": offer_details()}, format="json")
+        self.assertEqual(response.status_code, 201, response.content)
+        return response.data
+
+
+class BaseInfoTests(CoderrAPITestCase):
+
+    def test_etag_matches_served_body_and_returns_304(self):
+        response = self.client.get("/api/base-info/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["business_profile_count"], 2)
+
+        cached = self.client.get(
+            "/api/base-info/", HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(cached.content, b"")
+
+    def test_repeat_requests_are_served_from_the_response_cache(self):
+        first = self.client.get("/api/base-info/")
+        with self.assertNumQueries(0):
+            second = self.client.get("/api/base-info/")
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(second["ETag"], first["ETag"])
+
+    def test_etag_changes_with_the_payload(self):
+        etag = self.client.get("/api/base-info/")["ETag"]
+        Review.objects.create(business_user=self.business,
+                              reviewer=self.customer, rating=4)
+        cache.clear()
+
+        response = self.client.get("/api/base-info/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["review_count"], 1)
+        self.assertNotEqual(response["ETag"], etag)
+
+
+class OfferDetailTests(CoderrAPITestCase):
+
+    def test_matching_etag_returns_304_for_authenticated_user(self):
+        detail_id = self.create_offer()["details"][0]["id"]
+        response = self.client.get(f"/api/offerdetails/{detail_id}/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["price"], "100.00")
+
+        cached = self.client.get(
+            f"/api/offerdetails/{detail_id}/", HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(cached.status_code, 304)
+
+    def test_invalid_token_with_etag_returns_401(self):
+        detail_id = self.create_offer()["details"][0]["id"]
+        etag = self.client.get(f"/api/offerdetails/{detail_id}/")["ETag"]
+
+        self.client.credentials(HTTP_AUTHORIZATION="Token invalid")
+        response = self.client.get(
+            f"/api/offerdetails/{detail_id}/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 401)
+
+    def test_detail_patch_through_offer_changes_next_get(self):
+        offer = self.create_offer()
+        detail_id = offer["details"][0]["id"]
+        first = self.client.get(f"/api/offerdetails/{detail_id}/")
+        self.assertEqual(first.data["price"], "100.00")
+
+        response = self.client.patch(f"/api/offers/{offer['id']}/", {
+            "details": [{"id": detail_id, "offer_type": "basic", "price": "80.00"}]}, format="json")
+        self.assertEqual(response.status_code, 200, response.content)
+
+        second = self.client.get(
+            f"/api/offerdetails/{detail_id}/", HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.data["price"], "80.00")
+
+
+    def test_single_detail_save_changes_etag(self):
+        detail_id = self.create_offer()["details"][0]["id"]
+        first = self.client.get(f"/api/offerdetails/{detail_id}/")
+
+        detail = OfferDetail.objects.get(pk=detail_id)
+        detail.price = Decimal("70.00")
+        detail.save()
+
+        second = self.client.get(
+            f"/api/offerdetails/{detail_id}/", HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.data["price"], "70.00")
+        self.assertNotEqual(second["ETag"], first["ETag"])
+
+
+    def test_detail_deleted_during_retrieve_returns_404(self):
+        detail_id = self.create_offer()["details"][0]["id"]
+        updated_at = OfferDetail.objects.get(pk=detail_id).offer.updated_at
+        OfferDetail.objects.filter(pk=detail_id).delete()
+
+        with self.assertRaises(Http404):
+            serialize_offer_detail(detail_id, updated_at.timestamp())
+
+
+class OfferDetailBulkTests(CoderrAPITestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.detail_ids = [d["id"] for d in self.create_offer()["details"]]
+
+    def test_returns_requested_details_ordered_by_id(self):
+        ids = ",".join(str(i) for i in reversed(self.detail_ids))
+        response = self.client.get(f"/api/offerdetails/?ids={ids}")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([d["id"] for d in response.data], self.detail_ids)
+        self.assertEqual(response.data[0], self.client.get(
+            f"/api/offerdetails/{self.detail_ids[0]}/").data)
+
+    def test_repeated_ids_parameter_is_accepted(self):
+        response = self.client.get(
+            "/api/offerdetails/", {"ids": [self.detail_ids[0], self.detail_ids[1]]})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([d["id"] for d in response.data], self.detail_ids[:2])
+
+    def test_unknown_ids_are_skipped(self):
+        response = self.client.get(f"/api/offerdetails/?ids={self.detail_ids[0]},999999")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([d["id"] for d in response.data], [self.detail_ids[0]])
+
+    def test_missing_or_malformed_ids_return_400(self):
+        for url in ("/api/offerdetails/", "/api/offerdetails/?ids=", "/api/offerdetails/?ids=a"):
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 400)
+                self.assertIn("ids", response.data)
+
+    def test_more_than_50_ids_return_400(self):
+        ids = ",".join(str(i) for i in range(1, 52))
+        self.assertEqual(self.client.get(f"/api/offerdetails/?ids={ids}").status_code, 400)
+        ids = ",".join(str(i) for i in range(1, 51))
+        self.assertEqual(self.client.get(f"/api/offerdetails/?ids={ids}").status_code, 200)
+
+    def test_requires_authentication(self):
+        self.client.credentials()
+        response = self.client.get(f"/api/offerdetails/?ids={self.detail_ids[0]}")
+        self.assertEqual(response.status_code, 401)
+
+
+class OfferFilterTests(CoderrAPITestCase):
+
+    def test_min_price_filter_follows_detail_patch(self):
+        offer = self.create_offer()
+        other = self.create_offer(title="Other")
+        basic_id = next(d["id"] for d in offer["details"] if d["offer_type"] == "basic")
+
+        response = self.client.patch(f"/api/offers/{offer['id']}/", {
+            "details": [{"id": basic_id, "offer_type": "basic", "price": "50.00"}]}, format="json")
+        self.assertEqual(response.status_code, 200, response.content)
+
+        response = self.client.get("/api/offers/?min_price=90")
+        self.assertEqual([o["id"] for o in response.data["results"]], [other["id"]])
+
+        response = self.client.get("/api/offers/?min_price=40")
+        self.assertEqual(len(response.data["results"]), 2)
+
+
+class OfferCursorTests(CoderrAPITestCase):
+
+    def test_editing_an_offer_does_not_move_it_between_cursor_pages(self):
+        ids = [self.create_offer(title=f"Offer {i}")["id"] for i in range(3)]
+        first = self.client.get("/api/offers/?cursor=&page_size=2")
+        self.assertEqual([o["id"] for o in first.data["results"]], ids[:0:-1])
+
+        response = self.client.patch(
+            f"/api/offers/{ids[0]}/", {"title": "Edited"}, format="json")
+        self.assertEqual(response.status_code, 200, response.content)
+
+        second = self.client.get(first.data["next"])
+        self.assertEqual([o["id"] for o in second.data["results"]], [ids[0]])
+
+
+class Base64ImageFieldTests(CoderrAPITestCase):
+
+    def test_large_whitespace_payload_is_rejected(self):
+        field = Base64ImageField()
+        with self.assertRaises(serializers.ValidationError):
+            field.to_internal_value(" " * 1_000_001)
+
+
+class ReviewTests(CoderrAPITestCase):
+
+    def test_duplicate_review_returns_non_field_error(self):
+        self.authenticate(self.customer)
+        payload = {"business_user": self.business.id, "rating": 4, "description": "ok"}
+        self.assertEqual(self.client.post(
+            "/api/reviews/", payload, format="json").status_code, 201)
+
+        response = self.client.post("/api/reviews/", payload, format="json")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {
+            "non_field_errors": ["You have already reviewed this business user."]})
+        self.assertEqual(Review.objects.count(), 1)
+
+
+class ReviewCursorTests(CoderrAPITestCase):
+
+    def collect_ids(self, url):
+        ids = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200, response.content)
+            ids.extend(review["id"] for review in response.data["results"])
+            url = response.data["next"]
+        return ids
+
+    def test_cursor_pages_are_stable_for_equal_timestamps(self):
+        reviewers = [self.create_user(f"reviewer{i}", "customer") for i in range(7)]
+        for i, reviewer in enumerate(reviewers):
+            Review.objects.create(business_user=self.business,
+                                  reviewer=reviewer, rating=1 + i % 2)
+        Review.objects.update(created_at=timezone.now())
+        expected = list(Review.objects.order_by("-id").values_list("id", flat=True))
+
+        self.authenticate(self.customer)
+        self.assertEqual(self.collect_ids("/api/reviews/?cursor=&page_size=2"), expected)
+        self.assertEqual(self.collect_ids(
+            "/api/reviews/?cursor=&page_size=2&ordering=rating"), expected)
+
+    def test_editing_a_review_does_not_move_it_between_cursor_pages(self):
+        reviews = [Review.objects.create(business_user=self.business, rating=3,
+                                         reviewer=self.create_user(f"reviewer{i}", "customer"))
+                   for i in range(3)]
+        self.authenticate(self.customer)
+        first = self.client.get("/api/reviews/?cursor=&page_size=2")
+        self.assertEqual([r["id"] for r in first.data["results"]],
+                         [reviews[2].id, reviews[1].id])
+
+        reviews[0].rating = 5
+        reviews[0].save()
+
+        second = self.client.get(first.data["next"])
+        self.assertEqual([r["id"] for r in second.data["results"]], [reviews[0].id])
+
+
+class OrderCountTests(CoderrAPITestCase):
+
+    def test_user_without_profile_is_not_cached_as_missing(self):
+        user = User.objects.create_user("late", "late@example.com", "pass12345")
+        self.authenticate(self.customer)
+        self.assertEqual(self.client.get(f"/api/order-count/{user.id}/").status_code, 404)
+
+        Profile.objects.create(user=user, user_type="business")
+        response = self.client.get(f"/api/order-count/{user.id}/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, {"order_count": 0})
+
+
+class ProfileTests(CoderrAPITestCase):
+
+    def test_duplicate_email_returns_field_error_list(self):
+        self.authenticate(self.customer)
+        response = self.client.patch(
+            f"/api/profile/{self.customer.id}/", {"email": "business@example.com"}, format="json")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {"email": ["This email is already in use."]})
+        self.customer.refresh_from_db()
+        self.assertEqual(self.customer.email, "customer@example.com")
+
+    def test_email_update(self):
+        self.authenticate(self.customer)
+        response = self.client.patch(
+            f"/api/profile/{self.customer.id}/", {"email": "new@example.com"}, format="json")
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(response.data["email"], "new@example.com")
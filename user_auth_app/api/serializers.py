@@ -1,6 +1,8 @@
 from django.contrib.auth import get_user_model, authenticate
 from rest_framework import serializers
+from rest_framework.settings import api_settings
 from django.db import transaction, IntegrityError
+from rest_framework.authtoken.models import Token
 from coderr_app.models import Profile
 
 User = get_user_model()
@@ -15,30 +17,23 @@ class RegistrationSerializer(serializers.Serializer):
 
     Validation: 
         -Ensures both password fields match. 
-        -Checks for existing usernames or emails.
+        -Rejects existing usernames or emails via the database unique constraints on insert.
 
     Methods: 
         -create(validated_data):
-            Creates a new user and related profile in one atomic operation.
+            Creates a new user, the related profile and the auth token in one atomic operation.
     """
 
     username = serializers.CharField(max_length=150)
     email = serializers.EmailField()
     password = serializers.CharField(write_only=True, min_length=8)
     repeated_password = serializers.CharField(write_only=True, min_length=8)
-    type = serializers.ChoiceField(
-        choices=[('customer', 'Customer'), ('business', 'Business')])
+    type = serializers.ChoiceField(choices=Profile.TYPE_CHOICES)
 
     def validate(self, attrs):
         if attrs['password'] != attrs['repeated_password']:
             raise serializers.ValidationError(
                 "repeated_password: Passwords do not match.")
-        if User.objects.filter(username=attrs['username']).exists():
-            raise serializers.ValidationError(
-                "username: Username is already taken.")
-        if User.objects.filter(email=attrs['email']).exists():
-            raise serializers.ValidationError(
-                "email: Email is already registered.")
         return attrs
 
     @transaction.atomic
@@ -46,10 +41,20 @@ class RegistrationSerializer(serializers.Serializer):
         user_type = validated_data.pop('type')
         validated_data.pop('repeated_password')
 
-        user = User.objects.create_user(username=validated_data['username'],
-                                        email=validated_data['email'],
-                                        password=validated_data['password'],)
+        try:
+            with transaction.atomic():
+                user = User.objects.create_user(username=validated_data['username'],
+                                                email=validated_data['email'],
+                                                password=validated_data['password'],)
+        except IntegrityError:
+            # Decide by the data rather than by the backend's error text; the savepoint keeps the transaction usable.
+            message = ("username: Username is already taken."
+                       if User.objects.filter(username=validated_data['username']).exists()
+                       else "email: Email is already registered.")
+            raise serializers.ValidationError(
+                {api_settings.NON_FIELD_ERRORS_KEY: [message]})
         Profile.objects.create(user=user, user_type=user_type)
+        Token.objects.create(user=user)
         return user
 
 
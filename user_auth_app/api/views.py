@@ -1,6 +1,6 @@
 from rest_framework.views import APIView
 from rest_framework.response import Response
-from rest_framework import status
+from rest_framework import status, serializers
 from rest_framework.authtoken.models import Token
 from .serializers import RegistrationSerializer, LoginSerializer
 
@@ -25,7 +25,9 @@ class RegistrationView(APIView):
 
         try:
             user = serializer.save()
-            token, _ = Token.objects.get_or_create(user=user)
+            token = user.auth_token
+        except serializers.ValidationError as exc:
+            return Response(exc.detail, status=status.HTTP_400_BAD_REQUEST)
         except Exception:
             return Response({"detail": " Internal server error."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
@@ -0,0 +1,50 @@
+# Generated by Django 5.2.7 on 2026-10-14 09:00
+
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+# auth.User belongs to django.contrib.auth, so this app cannot add the constraint to the model state.
+# The schema editor creates it from the same UniqueConstraint definition instead.
+EMAIL_CONSTRAINT = models.UniqueConstraint(
+    fields=["email"], condition=~Q(email=""), name="uniq_user_email")
+
+
+def check_duplicate_emails(apps, schema_editor):
+    """
+    Aborts before the index is created if existing users share an email, listing the first few.
+    Those accounts have to be merged or given distinct emails by hand before migrating again.
+    """
+    User = apps.get_model("auth", "User")
+    duplicates = list(
+        User.objects.using(schema_editor.connection.alias)
+        .exclude(email="")
+        .values("email")
+        .annotate(n=Count("id"))
+        .filter(n__gt=1)
+        .values_list("email", flat=True)[:10]
+    )
+    if duplicates:
+        raise RuntimeError(
+            "Cannot add uniq_user_email, these emails are used by more than one user: "
+            + ", ".join(duplicates))
+
+
+def add_email_constraint(apps, schema_editor):
+    schema_editor.add_constraint(apps.get_model("auth", "User"), EMAIL_CONSTRAINT)
+
+
+def remove_email_constraint(apps, schema_editor):
+    schema_editor.remove_constraint(apps.get_model("auth", "User"), EMAIL_CONSTRAINT)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.RunPython(check_duplicate_emails, migrations.RunPython.noop),
+        migrations.RunPython(add_email_constraint, remove_email_constraint),
+    ]
@@ -1,3 +1,42 @@
-from django.test import TestCase
+from django.contrib.auth import get_user_model
+from rest_framework.test import APITestCase
+from coderr_app.models import Profile
 
-# Create your tests here.
+User = get_user_model()
+
+
+class RegistrationTests(APITestCase):
+
+    def register(self, username="newuser", email="new@example.com"):
+        return self.client.post("/api/registration/", {
+            "username": username, "email": email, "password": "pass12345",
+            "repeated_password": "pass12345", "type": "customer"}, format="json")
+
+    def test_registration_creates_user_profile_and_token(self):
+        response = self.register()
+        self.assertEqual(response.status_code, 201, response.content)
+        self.assertIn("token", response.data)
+        self.assertEqual(Profile.objects.get(user__username="newuser").user_type, "customer")
+
+    def test_duplicate_username_returns_non_field_error(self):
+        self.register()
+        response = self.register(email="other@example.com")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {
+            "non_field_errors": ["username: Username is already taken."]})
+        self.assertEqual(User.objects.count(), 1)
+
+    def test_duplicate_username_and_email_reports_the_username(self):
+        self.register()
+        response = self.register()
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {
+            "non_field_errors": ["username: Username is already taken."]})
+
+    def test_duplicate_email_returns_non_field_error(self):
+        self.register()
+        response = self.register(username="other")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {
+            "non_field_errors": ["email: Email is already registered."]})
+        self.assertEqual(User.objects.count(), 1)